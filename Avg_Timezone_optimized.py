@@ -4,142 +4,245 @@ from datetime import datetime
 import time
 from tqdm import tqdm
 import pytz
-import json
+import orjson
 from aiohttp import ClientTimeout
-import csv
-from collections import defaultdict
-import zipcodes
-from timezonefinder import TimezoneFinder
+import math
+import re
 import redis
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 import pickle
-from statistics import mean, median, stdev
 from datetime import datetime, timezone
 
 # Import ZIP codes
 from contiguous_usa_zip_codes import ZIP_CODES
+from generate_zipcodes import ZIP_TABLE_FILE, build_zip_table
 
 # Configuration
 API_URL = "https://api.sunrisesunset.io/json"
 GRID_SIZE = 1.0  # Size of grid squares in degrees
 REDIS_EXPIRY = 86400  # Cache results for 24 hours
+CACHE_PREFIX = "sunset:grid"  # Namespace for grid cache keys
 BATCH_SIZE = 100  # Number of grids to process in parallel
+MAX_IN_FLIGHT = 20  # Maximum concurrent API requests, also the per-host connection cap
+CSV_WRITE_ROWS = 1024  # Rows buffered before each CSV write
+TIMEOUT = ClientTimeout(total=10)  # Shared by every API request in the session
 
 # Initialize services
-tf = TimezoneFinder()
-redis_client = redis.Redis(host='localhost', port=6379, db=0)
+redis_pool = redis.ConnectionPool(
+    host='localhost', port=6379, db=0, max_connections=32,
+    socket_connect_timeout=0.5, socket_timeout=1.0
+)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+@lru_cache(maxsize=None)
+def _get_timezone(timezone_str: str):
+    """Return the pytz timezone for a name, reusing one object per name."""
+    return pytz.timezone(timezone_str)
+
+def utc_offsets(timezone_names, now: Optional[datetime] = None) -> Dict[str, float]:
+    """Return the UTC offset in hours at one instant for each timezone name."""
+    now = now or datetime.now(timezone.utc)
+    return {
+        name: now.astimezone(_get_timezone(name)).utcoffset().total_seconds() / 3600
+        for name in timezone_names
+    }
+
+def load_zip_table(path: str = ZIP_TABLE_FILE) -> Dict[str, np.ndarray]:
+    """Load the precomputed ZIP table, building it in-process if the file is missing."""
+    try:
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    except FileNotFoundError:
+        return build_zip_table(ZIP_CODES)
+
+# Per-ZIP lat/lon/state/timezone, indexed by position in ZIP_TABLE['zip']
+ZIP_TABLE = load_zip_table()
+ZIP_INDEX = {zip_code: i for i, zip_code in enumerate(ZIP_TABLE['zip'].tolist())}
+
+# In-process copy of grid results in front of Redis: key -> (expires_at, data)
+_grid_l1: Dict[str, Tuple[float, dict]] = {}
 
 class GridCache:
-    def __init__(self):
+    def __init__(self, prefix: str = CACHE_PREFIX):
         self.redis = redis_client
+        self.local = _grid_l1
+        self.prefix = prefix
         
     def get_cache_key(self, lat_grid: float, lon_grid: float) -> str:
-        return f"sunset:grid:{lat_grid:.1f}:{lon_grid:.1f}"
+        """Key on the grid size and the integer bin holding the point.
+
+        Any point inside a bin maps to the same key, and changing GRID_SIZE
+        never reads entries written at another resolution.
+        """
+        # The small offset keeps grid corners (bin * GRID_SIZE) in their own bin
+        lat_bin = math.floor(lat_grid / GRID_SIZE + 1e-9)
+        lon_bin = math.floor(lon_grid / GRID_SIZE + 1e-9)
+        return f"{self.prefix}:{GRID_SIZE:g}:{lat_bin}:{lon_bin}"
         
     def get_cached_result(self, lat_grid: float, lon_grid: float) -> Optional[dict]:
-        key = self.get_cache_key(lat_grid, lon_grid)
-        result = self.redis.get(key)
-        return pickle.loads(result) if result else None
+        return self.get_cached_batch([(lat_grid, lon_grid)])[0]
+        
+    def get_cached_batch(self, coords: List[Tuple[float, float]]) -> List[Optional[dict]]:
+        """Look up many grids, fetching all local misses from Redis in one round trip."""
+        keys = [self.get_cache_key(lat_grid, lon_grid) for lat_grid, lon_grid in coords]
+        now = time.monotonic()
+        results: List[Optional[dict]] = [None] * len(keys)
+        misses = []
+        for i, key in enumerate(keys):
+            entry = self.local.get(key)
+            if entry and entry[0] > now:
+                results[i] = entry[1]
+            else:
+                misses.append(i)
+                
+        if misses:
+            pipe = self.redis.pipeline(transaction=False)
+            for i in misses:
+                pipe.get(keys[i])
+                pipe.ttl(keys[i])
+            replies = pipe.execute()
+            for i, result, ttl in zip(misses, replies[::2], replies[1::2]):
+                if not result:
+                    continue
+                results[i] = pickle.loads(result)
+                if ttl and ttl > 0:
+                    self.local[keys[i]] = (now + ttl, results[i])
+        return results
         
     def set_cached_result(self, lat_grid: float, lon_grid: float, data: dict):
-        key = self.get_cache_key(lat_grid, lon_grid)
-        self.redis.setex(key, REDIS_EXPIRY, pickle.dumps(data))
+        self.set_cached_batch({(lat_grid, lon_grid): data})
+        
+    def set_cached_batch(self, items: Dict[Tuple[float, float], dict]):
+        """Store many grid results, writing them to Redis in one round trip."""
+        expires_at = time.monotonic() + REDIS_EXPIRY
+        pipe = self.redis.pipeline(transaction=False)
+        for (lat_grid, lon_grid), data in items.items():
+            key = self.get_cache_key(lat_grid, lon_grid)
+            self.local[key] = (expires_at, data)
+            pipe.setex(key, REDIS_EXPIRY, pickle.dumps(data))
+        pipe.execute()
 
 class GeographicBatcher:
     def __init__(self, zip_codes: List[str]):
         self.zip_codes = zip_codes
         self.grid_cache = GridCache()
-        self.grid_map: Dict[Tuple[float, float], List[dict]] = defaultdict(list)
-        
-    def _is_contiguous_us(self, location: dict) -> bool:
-        """Check if a location is in the contiguous United States."""
-        state = location.get('state')
-        # Exclude Alaska (AK), Hawaii (HI), and Puerto Rico (PR)
-        return state not in ['AK', 'HI', 'PR']
+        # Struct-of-arrays view of the batched ZIP codes, filled by prepare_batches
+        self.rows = np.empty(0, dtype=np.intp)  # Positions in ZIP_TABLE
+        self.lats = np.empty(0, dtype=np.float64)
+        self.lons = np.empty(0, dtype=np.float64)
+        self.offsets = np.empty(0, dtype=np.float64)  # UTC offset in hours
+        self.grid_keys = np.empty(0, dtype=np.int64)  # Sorted unique packed grid cells
+        self.grid_ids = np.empty(0, dtype=np.intp)  # Per-ZIP index into grid_keys
+        self._grid_map: Optional[Dict[Tuple[float, float], List[dict]]] = None
         
-    def _get_grid_coordinates(self, lat: float, lon: float) -> Tuple[float, float]:
-        """Convert exact coordinates to grid coordinates."""
-        lat_grid = np.floor(lat / GRID_SIZE) * GRID_SIZE
-        lon_grid = np.floor(lon / GRID_SIZE) * GRID_SIZE
-        return (lat_grid, lon_grid)
+    def _get_grid_cells(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert arrays of exact coordinates to integer grid cell indices."""
+        lat_cells = np.floor(lats / GRID_SIZE).astype(np.int64)
+        lon_cells = np.floor(lons / GRID_SIZE).astype(np.int64)
+        return (lat_cells, lon_cells)
         
     def prepare_batches(self) -> Dict[Tuple[float, float], List[dict]]:
         """Group ZIP codes into geographic grid squares."""
-        for zip_code in self.zip_codes:
-            location = zipcodes.matching(zip_code)
-            if not location:
-                continue
-                
-            location = location[0]
-            # Skip if not in contiguous US
-            if not self._is_contiguous_us(location):
-                continue
-                
-            lat = float(location['lat'])
-            lon = float(location['long'])
+        # ZIP codes missing from the table (no coordinates or timezone) are skipped
+        self.rows = np.fromiter(
+            (i for i in map(ZIP_INDEX.get, self.zip_codes) if i is not None),
+            dtype=np.intp
+        )
+        self.lats = ZIP_TABLE['lat'][self.rows].astype(np.float64)
+        self.lons = ZIP_TABLE['lon'][self.rows].astype(np.float64)
+        
+        tz_names, tz_ids = np.unique(ZIP_TABLE['tz'][self.rows], return_inverse=True)
+        # Offsets are taken now, once per timezone in this run, so they follow DST
+        tz_offsets = utc_offsets(tz_names.tolist())
+        self.offsets = np.array([tz_offsets[name] for name in tz_names.tolist()], dtype=np.float64)[tz_ids.ravel()]
+        
+        # Pack each (lat, lon) cell into one int64 key and group on it
+        lat_cells, lon_cells = self._get_grid_cells(self.lats, self.lons)
+        keys = (lat_cells << 32) | (lon_cells & 0xFFFFFFFF)
+        self.grid_keys, grid_ids = np.unique(keys, return_inverse=True)
+        self.grid_ids = grid_ids.ravel()
+        
+        self._grid_map = None
+        return self.grid_map
+        
+    @property
+    def grid_map(self) -> Dict[Tuple[float, float], List[dict]]:
+        """Map of grid (lat, lon) corner to its locations, built on first access."""
+        if self._grid_map is None:
+            lat_grids = (self.grid_keys >> 32) * GRID_SIZE
+            lon_grids = (((self.grid_keys & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000) * GRID_SIZE
             
-            # Get timezone information
-            timezone_str = tf.timezone_at(lat=lat, lng=lon)
-            if not timezone_str:
-                continue
-                
-            tz = pytz.timezone(timezone_str)
-            utc_offset = datetime.now(tz).utcoffset().total_seconds() / 3600
+            # ZIP positions ordered by grid, split into one slice per grid
+            order = np.argsort(self.grid_ids, kind='stable')
+            bounds = np.cumsum(np.bincount(self.grid_ids, minlength=len(self.grid_keys)))[:-1]
             
-            grid_coords = self._get_grid_coordinates(lat, lon)
-            self.grid_map[grid_coords].append({
-                'zip_code': zip_code,
-                'lat': lat,
-                'lon': lon,
-                'timezone_offset': utc_offset
-            })
+            zip_codes = ZIP_TABLE['zip'][self.rows].tolist()
+            lats = self.lats.tolist()
+            lons = self.lons.tolist()
+            offsets = self.offsets.tolist()
             
-        return self.grid_map
+            self._grid_map = {
+                (lat_grid, lon_grid): [
+                    {
+                        'zip_code': zip_codes[j],
+                        'lat': lats[j],
+                        'lon': lons[j],
+                        'timezone_offset': offsets[j]
+                    }
+                    for j in members.tolist()
+                ]
+                for lat_grid, lon_grid, members in zip(
+                    lat_grids.tolist(), lon_grids.tolist(), np.split(order, bounds)
+                )
+            }
+        return self._grid_map
 
 class RateLimiter:
-    def __init__(self, calls_per_second: int = 10):
+    """Token bucket: a background task adds one token every 1/calls_per_second.
+
+    The bucket starts empty and holds at most `burst` tokens, so callers never
+    exceed calls_per_second plus that burst in any one-second window.
+    """
+    def __init__(self, calls_per_second: int = 10, burst: int = 1):
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0
-        self._lock = asyncio.Lock()
+        self.burst = burst
+        self._available = 0  # Tokens released but not yet taken
+        self._tokens = asyncio.Semaphore(0)
+        self._refill_task: Optional[asyncio.Task] = None
+
+    async def _refill(self):
+        while True:
+            await asyncio.sleep(self.min_interval)
+            if self._available < self.burst:
+                self._available += 1
+                self._tokens.release()
 
     async def acquire(self):
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self.last_call = time.time()
+        if self._refill_task is None:
+            self._refill_task = asyncio.create_task(self._refill())
+        await self._tokens.acquire()
+        self._available -= 1
 
-async def fetch_grid_sunset(
+    def close(self):
+        """Stop the refill task."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+
+async def request_grid_sunset(
     session: aiohttp.ClientSession,
     grid_lat: float,
     grid_lon: float,
-    locations: List[dict],
     rate_limiter: RateLimiter,
-    pbar: tqdm
-) -> List[dict]:
-    """Fetch sunset time for a grid coordinate and apply to all locations in that grid."""
-    try:
-        # Check cache first
-        cache = GridCache()
-        cached_result = cache.get_cached_result(grid_lat, grid_lon)
-        
-        if cached_result:
-            results = []
-            for loc in locations:
-                results.append({
-                    'zip_code': loc['zip_code'],
-                    'sunset_time': cached_result['sunset_time'],
-                    'timezone_offset': loc['timezone_offset']
-                })
-            pbar.update(len(locations))
-            return results
-            
-        # If not in cache, fetch from API
+    semaphore: asyncio.Semaphore
+) -> Optional[str]:
+    """Request the sunset time at the center of a grid from the API."""
+    # The semaphore bounds requests in flight
+    async with semaphore:
         await rate_limiter.acquire()
-        timeout = ClientTimeout(total=10)
         
         # Use center of grid for API call
         center_lat = grid_lat + (GRID_SIZE / 2)
@@ -149,65 +252,119 @@ async def fetch_grid_sunset(
         today = datetime.now().strftime('%Y-%m-%d')
         
         async with session.get(
-            f"{API_URL}?lat={center_lat}&lng={center_lon}&date={today}",
-            timeout=timeout
+            f"{API_URL}?lat={center_lat}&lng={center_lon}&date={today}"
         ) as response:
             if response.status != 200:
                 print(f"Error: API returned status {response.status} for grid {grid_lat}, {grid_lon}")
-                pbar.update(len(locations))
-                return []
+                return None
 
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             if not data or "results" not in data or "sunset" not in data["results"]:
                 print(f"Error: Invalid API response for grid {grid_lat}, {grid_lon}")
-                pbar.update(len(locations))
-                return []
+                return None
+
+            return data["results"]["sunset"]
+
+async def fetch_grid_sunset(
+    session: aiohttp.ClientSession,
+    grid_lat: float,
+    grid_lon: float,
+    locations: List[dict],
+    cached_result: Optional[dict],
+    cache_updates: Dict[Tuple[float, float], dict],
+    rate_limiter: RateLimiter,
+    semaphore: asyncio.Semaphore,
+    pbar: tqdm
+) -> List[dict]:
+    """Fetch sunset time for a grid coordinate and apply to all locations in that grid.
 
-            sunset_time = data["results"]["sunset"]
+    cached_result is the grid's preloaded cache entry (None for a miss); new
+    API results are added to cache_updates for the caller to store in bulk.
+    """
+    try:
+        if cached_result:
+            sunset_time = cached_result['sunset_time']
+        else:
+            # If not in cache, fetch from API
+            sunset_time = await request_grid_sunset(
+                session, grid_lat, grid_lon, rate_limiter, semaphore
+            )
+            if sunset_time is not None:
+                cache_updates[(grid_lat, grid_lon)] = {'sunset_time': sunset_time}
+        
+        if sunset_time is None:
+            pbar.update(len(locations))
+            return []
             
-            # Cache the result
-            cache.set_cached_result(grid_lat, grid_lon, {
-                'sunset_time': sunset_time
+        # Apply to all locations in grid
+        results = []
+        for loc in locations:
+            results.append({
+                'zip_code': loc['zip_code'],
+                'sunset_time': sunset_time,
+                'timezone_offset': loc['timezone_offset']
             })
-            
-            # Apply to all locations in grid
-            results = []
-            for loc in locations:
-                results.append({
-                    'zip_code': loc['zip_code'],
-                    'sunset_time': sunset_time,
-                    'timezone_offset': loc['timezone_offset']
-                })
-            pbar.update(len(locations))
-            return results
+        pbar.update(len(locations))
+        return results
                 
     except Exception as e:
         print(f"Error processing grid {grid_lat}, {grid_lon}: {str(e)}")
         pbar.update(len(locations))
         return []
 
+# Matches the whole of "7:03:48 PM", "19:03:48" and ISO or space-separated
+# timestamps such as "2024-06-01T19:03:48.123+00:00"
+_TIME_RE = re.compile(
+    r'(?:\d{4}-\d{2}-\d{2}[T ])?(\d{1,2}):(\d{2}):(\d{2})(?:\.\d+)?'
+    r'(?:\s*([AP]M)|Z|[+-]\d{2}:?\d{2})?',
+    re.IGNORECASE
+)
+
+# What may follow the seconds field of an ISO timestamp on the fast path
+_ISO_SUFFIX_RE = re.compile(r'(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?')
+
+def _invalid_time(time_str, reason):
+    """Report an unparseable time and return the ValueError to raise."""
+    print(f"Error parsing time '{time_str}': {reason}")
+    return ValueError(f"Invalid time {time_str!r}: {reason}")
+
+def _checked_seconds(time_str, hours, minutes, seconds):
+    """Return seconds since midnight, rejecting out-of-range fields."""
+    if hours >= 24 or minutes >= 60 or seconds >= 60:
+        raise _invalid_time(time_str, "field out of range")
+    return hours * 3600 + minutes * 60 + seconds
+
+@lru_cache(maxsize=8192)
 def time_to_seconds(time_str):
     """Convert time string to seconds since midnight."""
-    try:
-        # Try parsing 12-hour format (e.g., "7:03:48 PM")
-        try:
-            time_obj = datetime.strptime(time_str, "%I:%M:%S %p")
-            return time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second
-        except ValueError:
-            # Try parsing 24-hour format (e.g., "19:03:48")
-            try:
-                time_obj = datetime.strptime(time_str, "%H:%M:%S")
-                return time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second
-            except ValueError:
-                # Try parsing ISO format
-                if time_str.endswith('Z'):
-                    time_str = time_str[:-1] + '+00:00'
-                time_obj = datetime.fromisoformat(time_str).time()
-                return time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second
-    except Exception as e:
-        print(f"Error parsing time '{time_str}': {str(e)}")
-        raise e
+    # Fast path for ISO timestamps such as "2024-06-01T19:34:22+00:00", accepting
+    # exactly what _TIME_RE does (isdecimal is the same class as the regex's \d)
+    if (len(time_str) >= 19 and time_str[4] == '-' and time_str[7] == '-' and time_str[10] == 'T'
+            and time_str[13] == ':' and time_str[16] == ':'
+            and time_str[:4].isdecimal() and time_str[5:7].isdecimal() and time_str[8:10].isdecimal()
+            and time_str[11:13].isdecimal() and time_str[14:16].isdecimal() and time_str[17:19].isdecimal()
+            and _ISO_SUFFIX_RE.fullmatch(time_str, 19)):
+        return _checked_seconds(
+            time_str, int(time_str[11:13]), int(time_str[14:16]), int(time_str[17:19])
+        )
+    
+    match = _TIME_RE.fullmatch(time_str.strip())
+    if match is None:
+        raise _invalid_time(time_str, "unrecognized format")
+    
+    hours, minutes, seconds, meridiem = match.groups()
+    hours = int(hours)
+    if meridiem:
+        if not 1 <= hours <= 12:
+            raise _invalid_time(time_str, "12-hour time needs an hour from 1 to 12")
+        meridiem = meridiem.upper()
+        if meridiem == 'PM' and hours < 12:
+            hours += 12
+        elif meridiem == 'AM' and hours == 12:
+            hours = 0
+    return _checked_seconds(time_str, hours, int(minutes), int(seconds))
 
+@lru_cache(maxsize=86400)
 def seconds_to_time(seconds):
     """Convert seconds since midnight to HH:MM:SS format."""
     hours = (seconds // 3600) % 24  # Ensure hours stay within 0-23 range
@@ -220,57 +377,65 @@ def calculate_statistics(results: List[dict]) -> dict:
     if not results:
         return {}
         
-    # Convert all times to seconds for calculations
-    seconds_list = [time_to_seconds(r['sunset_time']) for r in results]
+    # Convert all times to seconds, parsing each distinct string once
+    # (every ZIP in a grid shares the grid's sunset time)
+    unique_times, time_idx = np.unique(
+        np.array([r['sunset_time'] for r in results]), return_inverse=True
+    )
+    seconds = np.fromiter(
+        (time_to_seconds(t) for t in unique_times.tolist()),
+        dtype=np.int64, count=len(unique_times)
+    )[time_idx.ravel()]
     
     # Basic statistics
-    avg_seconds = mean(seconds_list)
-    median_seconds = median(seconds_list)
-    std_seconds = stdev(seconds_list)
+    avg_seconds = seconds.mean()
+    median_seconds = np.median(seconds)
+    std_seconds = seconds.std(ddof=1) if len(results) > 1 else None
     
     # Find earliest and latest with their ZIP codes
-    earliest_idx = seconds_list.index(min(seconds_list))
-    latest_idx = seconds_list.index(max(seconds_list))
+    earliest_idx = int(np.argmin(seconds))
+    latest_idx = int(np.argmax(seconds))
     earliest_data = results[earliest_idx]
     latest_data = results[latest_idx]
     
     # Calculate time ranges
-    time_range_seconds = max(seconds_list) - min(seconds_list)
+    time_range_seconds = seconds[latest_idx] - seconds[earliest_idx]
     
     # Group by hour
-    hours_distribution = defaultdict(int)
-    for seconds in seconds_list:
-        hour = seconds // 3600
-        hours_distribution[hour] += 1
+    hour_counts = np.bincount(seconds // 3600, minlength=24)
+    hours_distribution = {
+        hour: int(hour_counts[hour]) for hour in np.flatnonzero(hour_counts).tolist()
+    }
     
     # Calculate percentiles
-    percentiles = {
-        "10th": np.percentile(seconds_list, 10),
-        "25th": np.percentile(seconds_list, 25),
-        "50th": np.percentile(seconds_list, 50),
-        "75th": np.percentile(seconds_list, 75),
-        "90th": np.percentile(seconds_list, 90)
-    }
+    percentiles = dict(zip(
+        ["10th", "25th", "50th", "75th", "90th"],
+        np.percentile(seconds, [10, 25, 50, 75, 90]).tolist()
+    ))
     
-    # Group by timezone offset
-    timezone_groups = defaultdict(list)
-    for r in results:
-        timezone_groups[r['timezone_offset']].append(time_to_seconds(r['sunset_time']))
+    # Group by timezone offset, keeping offsets in order of first appearance
+    offsets = np.fromiter(
+        (r['timezone_offset'] for r in results), dtype=np.float64, count=len(results)
+    )
+    _, first_idx, group = np.unique(offsets, return_index=True, return_inverse=True)
+    counts = np.bincount(group)
+    means = np.bincount(group, weights=seconds) / counts
+    sq_dev = np.bincount(group, weights=(seconds - means[group]) ** 2)
     
-    timezone_stats = {
-        str(offset): {
-            "count": len(times),
-            "average": seconds_to_time(int(mean(times))),
-            "std_dev_minutes": f"{(stdev(times) / 60):.2f}" if len(times) > 1 else "N/A"
+    timezone_stats = {}
+    for g in np.argsort(first_idx).tolist():
+        count = int(counts[g])
+        timezone_stats[str(results[first_idx[g]]['timezone_offset'])] = {
+            "count": count,
+            "average": seconds_to_time(int(means[g])),
+            "std_dev_minutes": f"{(np.sqrt(sq_dev[g] / (count - 1)) / 60):.2f}" if count > 1 else "N/A"
         }
-        for offset, times in timezone_groups.items()
-    }
     
     return {
         "summary_statistics": {
             "average_sunset": seconds_to_time(int(avg_seconds)),
             "median_sunset": seconds_to_time(int(median_seconds)),
-            "standard_deviation_minutes": f"{(std_seconds / 60):.2f}",
+            "standard_deviation_minutes": f"{(std_seconds / 60):.2f}" if std_seconds is not None else "N/A",
             "total_locations": len(results)
         },
         "range_analysis": {
@@ -303,22 +468,65 @@ def calculate_statistics(results: List[dict]) -> dict:
         "timezone_analysis": timezone_stats
     }
 
-async def process_all_zips():
+def format_csv_rows(rows: List[dict]) -> str:
+    """Format result rows as CSV lines in one string (no field needs quoting)."""
+    return "".join(
+        f"{r['zip_code']},{r['sunset_time']},{r['timezone_offset']}\r\n" for r in rows
+    )
+
+def create_session() -> aiohttp.ClientSession:
+    """Create an API session with the shared timeout and connection limits."""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=MAX_IN_FLIGHT,  # Every request goes to the one API host
+        ttl_dns_cache=3600,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=TIMEOUT)
+
+async def process_all_zips(
+    zip_codes: Optional[List[str]] = None,
+    session: Optional[aiohttp.ClientSession] = None
+):
+    """Fetch sunset times for the ZIP codes (default: all) and write the CSV and summary files.
+
+    Pass a session from create_session() to reuse its connections and DNS
+    cache across runs; otherwise a session is created and closed here.
+    """
+    if zip_codes is None:
+        zip_codes = ZIP_CODES
+    
     # Initialize batcher and prepare grid batches
-    batcher = GeographicBatcher(ZIP_CODES)
+    batcher = GeographicBatcher(zip_codes)
     grid_map = batcher.prepare_batches()
     
     total_locations = sum(len(locations) for locations in grid_map.values())
     print(f"Grouped {total_locations} ZIP codes into {len(grid_map)} geographic grids")
     
+    # Look up every grid with one Redis round trip; misses go straight to the API
+    grid_cache = batcher.grid_cache
+    try:
+        cached = dict(zip(grid_map, grid_cache.get_cached_batch(list(grid_map))))
+    except redis.RedisError as e:
+        print(f"Warning: could not load grid cache: {str(e)}")
+        cached = {}
+    cache_updates: Dict[Tuple[float, float], dict] = {}
+    
     rate_limiter = RateLimiter(calls_per_second=10)
-    connector = aiohttp.TCPConnector(limit=100)
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+    owns_session = session is None
+    if owns_session:
+        session = create_session()
     
     results = []
+    pending = []  # Rows waiting to be written to the CSV
     
-    # Process grids in batches
-    with tqdm(total=total_locations, desc="Processing ZIP codes") as pbar:
-        async with aiohttp.ClientSession(connector=connector) as session:
+    # Process grids in batches, writing rows in blocks as grids complete
+    try:
+        with open('sunset_times.csv', 'w', newline='') as csvfile, \
+                tqdm(total=total_locations, desc="Processing ZIP codes") as pbar:
+            csvfile.write("zip_code,sunset_time,timezone_offset\r\n")
+            
             grid_items = list(grid_map.items())
             
             for i in range(0, len(grid_items), BATCH_SIZE):
@@ -328,21 +536,33 @@ async def process_all_zips():
                 for (grid_lat, grid_lon), locations in batch:
                     task = fetch_grid_sunset(
                         session, grid_lat, grid_lon, locations,
-                        rate_limiter, pbar
+                        cached.get((grid_lat, grid_lon)), cache_updates,
+                        rate_limiter, semaphore, pbar
                     )
                     tasks.append(task)
                 
-                batch_results = await asyncio.gather(*tasks)
-                for grid_results in batch_results:
+                for fut in asyncio.as_completed(tasks):
+                    grid_results = await fut
+                    pending.extend(grid_results)
                     results.extend(grid_results)
-    
-    # Save results
-    with open('sunset_times.csv', 'w', newline='') as csvfile:
-        fieldnames = ['zip_code', 'sunset_time', 'timezone_offset']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for result in results:
-            writer.writerow(result)
+                    if len(pending) >= CSV_WRITE_ROWS:
+                        csvfile.write(format_csv_rows(pending))
+                        csvfile.flush()
+                        pending.clear()
+                
+                # Store this batch's new API results with one Redis round trip
+                if cache_updates:
+                    try:
+                        grid_cache.set_cached_batch(cache_updates)
+                    except redis.RedisError as e:
+                        print(f"Warning: could not update grid cache: {str(e)}")
+                    cache_updates.clear()
+            
+            csvfile.write(format_csv_rows(pending))
+    finally:
+        rate_limiter.close()
+        if owns_session:
+            await session.close()
     
     # Calculate and save enhanced summary
     if results:
@@ -352,8 +572,8 @@ async def process_all_zips():
         summary = {
             'data_summary': {
                 'total_processed': len(results),
-                'total_zips': len(ZIP_CODES),
-                'success_rate': f"{(len(results)/len(ZIP_CODES))*100:.2f}%",
+                'total_zips': len(zip_codes),
+                'success_rate': f"{(len(results)/len(zip_codes))*100:.2f}%",
                 'unique_grids_processed': len(grid_map)
             },
             'sunset_statistics': stats,
@@ -365,8 +585,8 @@ async def process_all_zips():
             }
         }
         
-        with open('sunset_summary.json', 'w') as f:
-            json.dump(summary, f, indent=4)
+        with open('sunset_summary.json', 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         
         print(f"\nProcessed {len(results)} ZIP codes using {len(grid_map)} geographic grids")
         print(f"Average sunset time: {stats['summary_statistics']['average_sunset']}")
@@ -375,5 +595,9 @@ async def process_all_zips():
     else:
         print("No valid sunset times were collected")
 
+def main(zip_codes: Optional[List[str]] = None):
+    """Run the full pipeline for the ZIP codes (default: all)."""
+    asyncio.run(process_all_zips(zip_codes))
+
 if __name__ == "__main__":
-    asyncio.run(process_all_zips()) 
\ No newline at end of file
+    main()
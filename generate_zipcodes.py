@@ -1,28 +1,113 @@
+import os
 import zipcodes
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from timezonefinder import TimezoneFinder
+
+# Precomputed per-ZIP lookup table loaded by Avg_Timezone_optimized.py
+ZIP_TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zip_table.npz")
+
+# Alaska, Hawaii and Puerto Rico are left out of the ZIP list
+NON_CONTIGUOUS_STATES = {'AK', 'HI', 'PR'}
 
 def generate_zip_codes():
     # Get all ZIP codes from the database
     all_zip_data = zipcodes.list_all()
     
-    # Extract just the ZIP codes and ensure they are 5 digits
-    zip_codes = [str(z['zip_code']).zfill(5) for z in all_zip_data]
+    # Extract just the contiguous US ZIP codes and ensure they are 5 digits
+    zip_codes = [
+        str(z['zip_code']).zfill(5) for z in all_zip_data
+        if z['state'] not in NON_CONTIGUOUS_STATES
+    ]
     
     # Sort and remove duplicates
     zip_codes = sorted(list(set(zip_codes)))
     
     return zip_codes
 
-# Generate and format the zip codes
-zip_codes = generate_zip_codes()
-print(f"Total zip codes: {len(zip_codes)}")
-print(f"First 10 zip codes: {zip_codes[:10]}")
-print(f"Last 10 zip codes: {zip_codes[-10:]}")
+# One in-memory TimezoneFinder per process, created on first use
+_tf = None
+
+def _get_timezone_finder():
+    global _tf
+    if _tf is None:
+        _tf = TimezoneFinder(in_memory=True)
+    return _tf
+
+# ZIP code -> first matching zipcodes record, built on first use
+_zip_map = None
+
+def _get_zip_map():
+    global _zip_map
+    if _zip_map is None:
+        _zip_map = {}
+        for z in zipcodes.list_all():
+            _zip_map.setdefault(z['zip_code'], z)
+    return _zip_map
 
-# Format in the requested style
-formatted_output = "ZIP_CODES = [" + ", ".join([f'"{zip_code}"' for zip_code in zip_codes]) + "]"
+def _resolve_zip_codes(zip_codes):
+    """Return (zip, lat, lon, state, timezone) rows for the ZIP codes that resolve."""
+    tf = _get_timezone_finder()
+    zip_map = _get_zip_map()
+    rows = []
+
+    for zip_code in zip_codes:
+        location = zip_map.get(zip_code)
+        if location is None:
+            continue
+
+        lat = float(location['lat'])
+        lon = float(location['long'])
+
+        timezone_str = tf.timezone_at(lat=lat, lng=lon)
+        if not timezone_str:
+            continue
+        
+        rows.append((zip_code, lat, lon, location['state'], timezone_str))
+    
+    return rows
 
-# Write to a file
-with open("contiguous_usa_zip_codes.py", "w") as f:
-    f.write(formatted_output)
+def build_zip_table(zip_codes, workers=1):
+    """Resolve coordinates, state and timezone name for each ZIP code.
 
-print(f"Complete list of {len(zip_codes)} zip codes written to contiguous_usa_zip_codes.py")
\ No newline at end of file
+    With workers > 1 the ZIP codes are split into contiguous chunks that are
+    resolved in a process pool; rows keep the input order.
+    """
+    if workers > 1:
+        chunks = [chunk.tolist() for chunk in np.array_split(list(zip_codes), workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = [row for chunk_rows in executor.map(_resolve_zip_codes, chunks) for row in chunk_rows]
+    else:
+        rows = _resolve_zip_codes(zip_codes)
+
+    zips, lats, lons, states, timezones = zip(*rows) if rows else ((), (), (), (), ())
+    
+    return {
+        'zip': np.array(zips),
+        'lat': np.array(lats, dtype=np.float32),
+        'lon': np.array(lons, dtype=np.float32),
+        'state': np.array(states),
+        'tz': np.array(timezones)
+    }
+
+if __name__ == "__main__":
+    # Generate and format the zip codes
+    zip_codes = generate_zip_codes()
+    print(f"Total zip codes: {len(zip_codes)}")
+    print(f"First 10 zip codes: {zip_codes[:10]}")
+    print(f"Last 10 zip codes: {zip_codes[-10:]}")
+    
+    # Format in the requested style
+    formatted_output = "ZIP_CODES = [" + ", ".join([f'"{zip_code}"' for zip_code in zip_codes]) + "]"
+    
+    # Write to a file
+    with open("contiguous_usa_zip_codes.py", "w") as f:
+        f.write(formatted_output)
+    
+    print(f"Complete list of {len(zip_codes)} zip codes written to contiguous_usa_zip_codes.py")
+    
+    # Precompute the lookup table so runs skip the per-ZIP lookups
+    zip_table = build_zip_table(zip_codes, workers=os.cpu_count() or 1)
+    np.savez_compressed(ZIP_TABLE_FILE, **zip_table)
+    
+    print(f"Lookup table for {len(zip_table['zip'])} zip codes written to {ZIP_TABLE_FILE}")
@@ -1,34 +1,105 @@
 import unittest
-import json
+import orjson
 import csv
+import io
 import os
+import time
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
 import redis
+import socket
+import sys
+from urllib.parse import urlsplit
 from Avg_Timezone_optimized import (
     GeographicBatcher,
     GridCache,
+    RateLimiter,
     time_to_seconds,
     seconds_to_time,
     calculate_statistics,
+    create_session,
+    format_csv_rows,
+    main,
+    redis_pool,
+    API_URL,
+    GRID_SIZE,
     ZIP_CODES
 )
 
+# First 10 ZIP codes, sliced once for quick testing
+TEST_ZIP_CODES = ZIP_CODES[:10]
+
+# Cache namespace for fake test values, kept apart from real grid results
+TEST_CACHE_PREFIX = f"sunset:test:{os.getpid()}"
+
+def _redis_available():
+    """Check once whether the Redis server answers."""
+    try:
+        return redis.Redis(connection_pool=redis_pool).ping()
+    except redis.RedisError:
+        return False
+
+REDIS_AVAILABLE = _redis_available()
+
+def _api_available():
+    """Check once whether the sunrise-sunset API host accepts connections."""
+    try:
+        socket.create_connection((urlsplit(API_URL).hostname, 443), timeout=2).close()
+        return True
+    except OSError:
+        return False
+
+API_AVAILABLE = _api_available()
+
+# TTL the stub reports for every stored key
+REDIS_TTL_STUB = 3600
+
+class _StubPipeline:
+    """Queues commands for _StubRedis and runs them on execute()."""
+    def __init__(self, redis_stub):
+        self.redis_stub = redis_stub
+        self.commands = []
+        
+    def get(self, key):
+        self.commands.append(lambda: self.redis_stub.store.get(key))
+        
+    def ttl(self, key):
+        self.commands.append(lambda: REDIS_TTL_STUB if key in self.redis_stub.store else -2)
+        
+    def setex(self, key, expiry, value):
+        self.commands.append(lambda: self.redis_stub.store.__setitem__(key, value))
+        
+    def execute(self):
+        self.redis_stub.round_trips += 1
+        return [command() for command in self.commands]
+
+class _StubRedis:
+    """In-memory Redis stand-in that counts pipeline round trips."""
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+        
+    def pipeline(self, transaction=True):
+        return _StubPipeline(self)
+
 class TestSunsetCalculator(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Initialize test environment."""
-        cls.redis_client = redis.Redis(host='localhost', port=6379, db=0)
-        # Use first 10 ZIP codes for quick testing
-        cls.test_zip_codes = ZIP_CODES[:10]
+        cls.redis_client = redis.Redis(connection_pool=redis_pool)
+        cls.test_zip_codes = TEST_ZIP_CODES
         
     @classmethod
     def tearDownClass(cls):
         """Clean up after tests."""
-        # Clear test data from Redis
-        for key in cls.redis_client.keys("sunset:grid:*"):
-            cls.redis_client.delete(key)
+        if not REDIS_AVAILABLE:
+            return
+            
+        # Clear test data from Redis, unlinking keys in batches
+        keys = list(cls.redis_client.scan_iter(match=f"{TEST_CACHE_PREFIX}:*", count=1000))
+        for i in range(0, len(keys), 500):
+            cls.redis_client.unlink(*keys[i:i + 500])
             
     def test_geographic_batching(self):
         """Test that ZIP codes are correctly grouped into grids."""
@@ -42,10 +113,14 @@ class TestSunsetCalculator(unittest.TestCase):
             self.assertTrue(-90 <= lat <= 90, f"Invalid latitude: {lat}")
             self.assertTrue(-180 <= lon <= 180, f"Invalid longitude: {lon}")
             self.assertTrue(len(locations) > 0, "Grid should contain locations")
+            for loc in locations:
+                self.assertTrue(lat <= loc['lat'] < lat + GRID_SIZE, f"ZIP {loc['zip_code']} outside its grid")
+                self.assertTrue(lon <= loc['lon'] < lon + GRID_SIZE, f"ZIP {loc['zip_code']} outside its grid")
             
+    @unittest.skipUnless(REDIS_AVAILABLE, "Redis server not reachable")
     def test_redis_caching(self):
         """Test Redis caching functionality."""
-        cache = GridCache()
+        cache = GridCache(prefix=TEST_CACHE_PREFIX)
         test_data = {"sunset_time": "7:30:00 PM"}
         
         # Test setting cache
@@ -55,6 +130,51 @@ class TestSunsetCalculator(unittest.TestCase):
         cached = cache.get_cached_result(35.0, -75.0)
         self.assertEqual(cached, test_data, "Cache retrieval failed")
         
+    def test_cache_key_bins(self):
+        """Test that points in the same grid bin share a cache key."""
+        cache = GridCache(prefix=TEST_CACHE_PREFIX)
+        self.assertEqual(cache.get_cache_key(35.0, -75.0), cache.get_cache_key(35.4, -74.6))
+        self.assertNotEqual(cache.get_cache_key(35.0, -75.0), cache.get_cache_key(35.0, -75.1))
+        
+    @unittest.skipUnless(REDIS_AVAILABLE, "Redis server not reachable")
+    def test_redis_batch_caching(self):
+        """Test that many grids are stored and read back in one batch."""
+        cache = GridCache(prefix=TEST_CACHE_PREFIX)
+        coords = [(float(lat), float(lon)) for lat in range(30, 40) for lon in range(-100, -90)]
+        items = {coord: {"sunset_time": f"7:{i // 60:02d}:{i % 60:02d} PM"} for i, coord in enumerate(coords)}
+        
+        cache.set_cached_batch(items)
+        # Force the read to go to Redis, leaving other callers' entries alone
+        for lat, lon in coords:
+            cache.local.pop(cache.get_cache_key(lat, lon), None)
+        
+        cached = cache.get_cached_batch(coords)
+        self.assertEqual(cached, [items[coord] for coord in coords], "Batch cache retrieval failed")
+        
+    def test_batch_cache_round_trips(self):
+        """Test that a 100-grid batch write and read each take one Redis round trip."""
+        cache = GridCache(prefix=f"{TEST_CACHE_PREFIX}:stub")
+        cache.redis = _StubRedis()
+        coords = [(float(lat), float(lon)) for lat in range(30, 40) for lon in range(-100, -90)]
+        items = {coord: {"sunset_time": f"7:{i // 60:02d}:{i % 60:02d} PM"} for i, coord in enumerate(coords)}
+        keys = [cache.get_cache_key(lat, lon) for lat, lon in coords]
+        try:
+            cache.set_cached_batch(items)
+            self.assertEqual(cache.redis.round_trips, 1, "Batch write should be one pipeline")
+            
+            # Cold read: every grid comes from Redis in one pipeline
+            for key in keys:
+                cache.local.pop(key)
+            self.assertEqual(cache.get_cached_batch(coords), [items[coord] for coord in coords])
+            self.assertEqual(cache.redis.round_trips, 2, "Batch read should be one pipeline")
+            
+            # Warm read: served from the in-process cache without Redis
+            self.assertEqual(cache.get_cached_batch(coords), [items[coord] for coord in coords])
+            self.assertEqual(cache.redis.round_trips, 2, "Warm batch read should not touch Redis")
+        finally:
+            for key in keys:
+                cache.local.pop(key, None)
+        
     def test_time_conversion(self):
         """Test time conversion functions."""
         test_times = [
@@ -71,6 +191,66 @@ class TestSunsetCalculator(unittest.TestCase):
             time_str_converted = seconds_to_time(seconds)
             self.assertTrue(":" in time_str_converted, f"Invalid time format: {time_str_converted}")
             
+    def test_time_parsing_formats(self):
+        """Test that each supported format parses to the same time of day."""
+        expected = 19 * 3600 + 30 * 60
+        test_times = [
+            "7:30:00 PM",
+            "7:30:00 pm",
+            "19:30:00",
+            "2023-05-01T19:30:00Z",
+            "2023-05-01T19:30:00.123+00:00",
+            "2023-05-01 19:30:00"
+        ]
+        
+        for time_str in test_times:
+            self.assertEqual(time_to_seconds(time_str), expected, f"Wrong seconds for {time_str}")
+            
+        self.assertEqual(time_to_seconds("12:15:00 AM"), 15 * 60)
+        self.assertEqual(time_to_seconds("12:15:00 PM"), 12 * 3600 + 15 * 60)
+        for time_str in ["not a time", "99:99:99", "25:00:00", "19:60:00", "19:30:60",
+                         "13:00:00 PM", "0:30:00 AM", "7:30:00 PMX",
+                         "2023-05-01T24:00:00Z", "2023-05-01T19:30:00garbage",
+                         "XXXXXXXXXXT19:30:00", "2023/05/01T19:30:00Z", "2023-05-0xT19:30:00"]:
+            with self.assertRaises(ValueError, msg=time_str):
+                time_to_seconds(time_str)
+            
+    def test_time_conversion_cache(self):
+        """Test that repeated conversions are served from the cache."""
+        hits_before = (time_to_seconds.cache_info().hits, seconds_to_time.cache_info().hits)
+        for _ in range(100):
+            self.assertEqual(seconds_to_time(time_to_seconds("7:30:00 PM")), "19:30:00")
+        
+        self.assertGreater(time_to_seconds.cache_info().hits, hits_before[0])
+        self.assertGreater(seconds_to_time.cache_info().hits, hits_before[1])
+        
+    def test_csv_formatting(self):
+        """Test that CSV rows read back with the original values."""
+        rows = [
+            {"zip_code": "00501", "sunset_time": "7:03:48 PM", "timezone_offset": -4.0},
+            {"zip_code": "10001", "sunset_time": "2024-06-01T19:34:22+00:00", "timezone_offset": -5.0}
+        ]
+        text = "zip_code,sunset_time,timezone_offset\r\n" + format_csv_rows(rows)
+        
+        parsed = list(csv.DictReader(io.StringIO(text, newline='')))
+        self.assertEqual(parsed, [{k: str(v) for k, v in row.items()} for row in rows])
+        
+    def test_rate_limiter_pacing(self):
+        """Test that N acquires take about N / calls_per_second seconds."""
+        calls, rate = 20, 50
+        
+        async def acquire_all():
+            rate_limiter = RateLimiter(calls_per_second=rate)
+            start = time.monotonic()
+            await asyncio.gather(*(rate_limiter.acquire() for _ in range(calls)))
+            elapsed = time.monotonic() - start
+            rate_limiter.close()
+            return elapsed
+        
+        elapsed = asyncio.run(acquire_all())
+        self.assertGreaterEqual(elapsed, 0.9 * calls / rate, "Rate limiter let calls through too fast")
+        self.assertLess(elapsed, calls / rate + 0.5, "Rate limiter is too slow")
+        
     def test_statistics_calculation(self):
         """Test statistics calculation."""
         test_results = [
@@ -87,68 +267,112 @@ class TestSunsetCalculator(unittest.TestCase):
         self.assertIn("percentile_distribution", stats)
         self.assertIn("hour_distribution", stats)
         self.assertIn("timezone_analysis", stats)
+        
+        # Verify computed values
+        self.assertEqual(stats["summary_statistics"]["average_sunset"], "19:30:00")
+        self.assertEqual(stats["summary_statistics"]["standard_deviation_minutes"], "30.00")
+        self.assertEqual(stats["range_analysis"]["earliest_sunset"]["zip_code"], "12345")
+        self.assertEqual(stats["range_analysis"]["latest_sunset"]["zip_code"], "34567")
+        self.assertEqual(stats["range_analysis"]["time_range_minutes"], "60.00")
+        self.assertEqual(stats["hour_distribution"]["19"]["count"], 2)
+        self.assertEqual(stats["hour_distribution"]["20"]["count"], 1)
+        self.assertEqual(list(stats["timezone_analysis"]), ["-4", "-5"])
+        self.assertEqual(stats["timezone_analysis"]["-4"]["average"], "19:15:00")
+        self.assertEqual(stats["timezone_analysis"]["-5"]["std_dev_minutes"], "N/A")
+        
+        # A single result has no standard deviation
+        single = calculate_statistics(test_results[:1])
+        self.assertEqual(single["summary_statistics"]["standard_deviation_minutes"], "N/A")
+
+# Shared by the async tests; created and closed by run_async_tests
+_session: aiohttp.ClientSession = None
+_semaphore: asyncio.Semaphore = None
 
 class AsyncTestSunsetCalculator(unittest.TestCase):
     async def test_api_connection(self):
         """Test connection to Sunset-Sunrise API."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://api.sunrisesunset.io/json?lat=40.7128&lng=-74.0060") as response:
+        async with _semaphore:
+            async with _session.get("https://api.sunrisesunset.io/json?lat=40.7128&lng=-74.0060") as response:
                 self.assertEqual(response.status, 200, "API connection failed")
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
                 self.assertIn("results", data, "Invalid API response format")
                 self.assertIn("sunset", data["results"], "No sunset time in response")
 
 class OutputTestSunsetCalculator(unittest.TestCase):
+    # The pipeline runs without Redis (cache errors are only warnings) but not without the API
+    @unittest.skipUnless(API_AVAILABLE, "Sunrise-sunset API not reachable")
     def test_output_files_small_subset(self):
         """Test that output files are created with correct format using a small subset of data."""
-        # Temporarily modify ZIP_CODES for quick testing
-        original_zip_codes = ZIP_CODES.copy()
-        ZIP_CODES.clear()
-        ZIP_CODES.extend(original_zip_codes[:10])  # Use only first 10 ZIP codes
+        # Run the main pipeline in-process on the first 10 ZIP codes
+        main(zip_codes=TEST_ZIP_CODES)
         
-        try:
-            # Run the main script
-            os.system("python Avg_Timezone_optimized.py")
+        # Check CSV file
+        self.assertTrue(os.path.exists("sunset_times.csv"), "CSV file not created")
+        with open("sunset_times.csv", 'r', newline='') as f:
+            # Only the header and the first row are needed to check the schema
+            reader = csv.reader(f)
+            header = next(reader)
+            self.assertIn("zip_code", header)
+            self.assertIn("sunset_time", header)
+            self.assertIn("timezone_offset", header)
+            self.assertEqual(len(next(reader)), len(header), "CSV row does not match header")
             
-            # Check CSV file
-            self.assertTrue(os.path.exists("sunset_times.csv"), "CSV file not created")
-            with open("sunset_times.csv", 'r') as f:
-                reader = csv.DictReader(f)
-                row = next(reader)
-                self.assertIn("zip_code", row)
-                self.assertIn("sunset_time", row)
-                self.assertIn("timezone_offset", row)
-                
-            # Check JSON file
-            self.assertTrue(os.path.exists("sunset_summary.json"), "JSON file not created")
-            with open("sunset_summary.json", 'r') as f:
-                data = json.load(f)
-                self.assertIn("data_summary", data)
-                self.assertIn("sunset_statistics", data)
-                self.assertIn("processing_info", data)
-        finally:
-            # Restore original ZIP_CODES
-            ZIP_CODES.clear()
-            ZIP_CODES.extend(original_zip_codes)
+        # Check JSON file
+        self.assertTrue(os.path.exists("sunset_summary.json"), "JSON file not created")
+        with open("sunset_summary.json", 'rb') as f:
+            data = orjson.loads(f.read())
+            self.assertIn("data_summary", data)
+            self.assertIn("sunset_statistics", data)
+            self.assertIn("processing_info", data)
+
+# One loader for every suite the __main__ runner builds
+LOADER = unittest.TestLoader()
 
 async def run_async_tests():
-    """Run async tests."""
-    async_suite = unittest.TestLoader().loadTestsFromTestCase(AsyncTestSunsetCalculator)
-    for test in async_suite._tests:
-        await test.test_api_connection()
+    """Run async tests over one shared session."""
+    global _session, _semaphore
+    _session = create_session()
+    _semaphore = asyncio.Semaphore(20)
+    try:
+        async_suite = LOADER.loadTestsFromTestCase(AsyncTestSunsetCalculator)
+        outcomes = await asyncio.gather(
+            *(test.test_api_connection() for test in async_suite._tests),
+            return_exceptions=True
+        )
+    finally:
+        await _session.close()
+        
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    for error in errors:
+        print(f"Async test failed: {error!r}")
+    if errors:
+        raise errors[0]
     print("Async tests completed successfully!")
 
 if __name__ == "__main__":
+    # Use uvloop for the asyncio.run call below when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    # The suites run one after another since they share module-level caches
+    # and the rate limiter test is timing-sensitive; for parallel runs use
+    # pytest with pytest-xdist (pytest -n auto), which isolates workers.
+    
     # Run synchronous tests
     print("\nRunning synchronous tests...")
-    sync_suite = unittest.TestLoader().loadTestsFromTestCase(TestSunsetCalculator)
-    unittest.TextTestRunner(verbosity=2).run(sync_suite)
+    sync_suite = LOADER.loadTestsFromTestCase(TestSunsetCalculator)
+    sync_result = unittest.TextTestRunner(verbosity=2).run(sync_suite)
     
     # Run output tests with small subset
     print("\nRunning output tests with small subset...")
-    output_suite = unittest.TestLoader().loadTestsFromTestCase(OutputTestSunsetCalculator)
-    unittest.TextTestRunner(verbosity=2).run(output_suite)
+    output_suite = LOADER.loadTestsFromTestCase(OutputTestSunsetCalculator)
+    output_result = unittest.TextTestRunner(verbosity=2).run(output_suite)
     
-    # Run async tests
+    # Run async tests; a failure raises and exits non-zero
     print("\nRunning asynchronous tests...")
-    asyncio.run(run_async_tests()) 
\ No newline at end of file
+    asyncio.run(run_async_tests())
+    
+    sys.exit(0 if sync_result.wasSuccessful() and output_result.wasSuccessful() else 1)